@@ -20,8 +20,14 @@ def manhattan(a, b):
     return abs(a[0]-b[0]) + abs(a[1]-b[1])
 
 class AgentBlue:
-    def __init__(self, name="Blue"):
+    def __init__(self, name="Blue", min_dist=MIN_DIST, shoot_range=SHOOT_RANGE,
+                 positive_items=POSITIVE_ITEMS, escape='corner'):
         self.name = name
+        # پارامترهای رفتاری (پیش‌فرض = ثابت‌های بالا)
+        self.min_dist = min_dist
+        self.shoot_range = shoot_range
+        self.positive_items = set(positive_items)
+        self.escape = escape        # 'corner' | 'edge'
         self.goal: Optional[Tuple[int, int]] = None
         self.path: Deque[Tuple[int, int]] = deque()
         self.known_walls: Set[Tuple[int, int]] = set()
@@ -32,7 +38,7 @@ class AgentBlue:
     def _safe_from_enemy(self, cell, enemy):
         if enemy is None:
             return True
-        return manhattan(cell, enemy) >= MIN_DIST
+        return manhattan(cell, enemy) >= self.min_dist
 
     def decide(
         self,
@@ -62,14 +68,14 @@ class AgentBlue:
         # اگر دشمن دیده می‌شود → فاصله مهم است
         if visible_enemy:
             dist_e = manhattan(cur, visible_enemy)
-            if dist_e < MIN_DIST:
+            if dist_e < self.min_dist:
                 # فرار کن
                 escape_point = self._escape_point(cur, visible_enemy, safe_zone)
                 self.path = deque(self._bfs(cur, escape_point, safe_zone, visible_enemy))
             else:
                 # اگر در خط تیر و فاصله مناسب → شلیک
                 aligned, aim_dir, d_e = self._line_of_fire(cur, visible_enemy)
-                if aligned and d_e <= SHOOT_RANGE:
+                if aligned and d_e <= self.shoot_range:
                     return aim_dir, True
                 # نزدیک شو تا فاصله ≥۳ حفظ شود
                 self.goal = visible_enemy
@@ -78,7 +84,7 @@ class AgentBlue:
             # دنبال آیتم مثبت
             pos_items = []
             for x1_, y1_, x2_, y2_, t in item_hints:
-                if t in POSITIVE_ITEMS:
+                if t in self.positive_items:
                     cx, cy = (x1_+x2_)//2, (y1_+y2_)//2
                     if inside((cx, cy)):
                         pos_items.append((cx, cy))
@@ -102,7 +108,7 @@ class AgentBlue:
         # دوباره چک شلیک
         if visible_enemy:
             aligned, aim_dir, d_e = self._line_of_fire(cur, visible_enemy)
-            if aligned and d_e <= SHOOT_RANGE:
+            if aligned and d_e <= self.shoot_range:
                 return aim_dir, True
 
         return direction, False
@@ -115,8 +121,13 @@ class AgentBlue:
     # انتخاب گوشه‌ای دور از دشمن
     def _escape_point(self, cur, enemy, safe):
         x1, y1, x2, y2 = safe
-        corners = [(x1,y1), (x1,y2), (x2,y1), (x2,y2)]
-        return max(corners, key=lambda c: manhattan(c, enemy))
+        if self.escape == 'edge':
+            # وسط ضلعی از زون که از دشمن دورتر است
+            cx, cy = (x1+x2)//2, (y1+y2)//2
+            points = [(cx,y1), (cx,y2), (x1,cy), (x2,cy)]
+        else:
+            points = [(x1,y1), (x1,y2), (x2,y1), (x2,y2)]
+        return max(points, key=lambda c: manhattan(c, enemy))
 
     def _line_of_fire(self, src, dst):
         sx, sy = src
@@ -20,8 +20,14 @@ def manhattan(a, b):
     return abs(a[0]-b[0]) + abs(a[1]-b[1])
 
 class AgentRed:
-    def __init__(self, name="Red"):
+    def __init__(self, name="Red", min_dist=MIN_DIST, shoot_range=SHOOT_RANGE,
+                 positive_items=POSITIVE_ITEMS, escape='corner'):
         self.name = name
+        # پارامترهای رفتاری (پیش‌فرض = ثابت‌های بالا)
+        self.min_dist = min_dist
+        self.shoot_range = shoot_range
+        self.positive_items = set(positive_items)
+        self.escape = escape        # 'corner' | 'edge'
         self.known_walls: Set[Tuple[int, int]] = set()
         self.path: deque = deque()
         self.goal: Optional[Tuple[int, int]] = None
@@ -29,7 +35,7 @@ class AgentRed:
     def _safe_dist(self, cell, enemy):
         if not enemy:
             return True
-        return manhattan(cell, enemy) >= MIN_DIST
+        return manhattan(cell, enemy) >= self.min_dist
 
     def decide(self, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
         self.known_walls.update(visible_walls)
@@ -45,19 +51,19 @@ class AgentRed:
 
         # دشمن دیده می‌شود
         if visible_enemy:
-            if manhattan(cur, visible_enemy) < MIN_DIST:
+            if manhattan(cur, visible_enemy) < self.min_dist:
                 escape_point = self._escape_point(cur, visible_enemy, safe_zone)
                 self.path = deque(self._bfs(cur, escape_point, safe_zone, visible_enemy))
             else:
                 aligned, shoot_dir, d_e = self._line_of_fire(cur, visible_enemy)
-                if aligned and d_e <= SHOOT_RANGE:
+                if aligned and d_e <= self.shoot_range:
                     return shoot_dir, True
                 self.goal = visible_enemy
                 self.path = deque(self._bfs(cur, self.goal, safe_zone, visible_enemy))
         else:
             items = []
             for x3, y3, x4, y4, t in item_hints:
-                if t in POSITIVE_ITEMS:
+                if t in self.positive_items:
                     cx, cy = (x3+x4)//2, (y3+y4)//2
                     if inside((cx, cy)):
                         items.append((cx, cy))
@@ -79,7 +85,7 @@ class AgentRed:
         # دوباره check شلیک
         if visible_enemy:
             aligned, shoot_dir, d_e = self._line_of_fire(cur, visible_enemy)
-            if aligned and d_e <= SHOOT_RANGE:
+            if aligned and d_e <= self.shoot_range:
                 return shoot_dir, True
 
         return direction, False
@@ -105,8 +111,13 @@ class AgentRed:
 
     def _escape_point(self, cur, enemy, safe):
         x1, y1, x2, y2 = safe
-        corners = [(x1,y1), (x1,y2), (x2,y1), (x2,y2)]
-        return max(corners, key=lambda c: manhattan(c, enemy))
+        if self.escape == 'edge':
+            # وسط ضلعی از زون که از دشمن دورتر است
+            cx, cy = (x1+x2)//2, (y1+y2)//2
+            points = [(cx,y1), (cx,y2), (x1,cy), (x2,cy)]
+        else:
+            points = [(x1,y1), (x1,y2), (x2,y1), (x2,y2)]
+        return max(points, key=lambda c: manhattan(c, enemy))
 
     def _bfs(self, start, goal, safe, enemy):
         x1, y1, x2, y2 = safe
@@ -6,6 +6,7 @@ import os
 
 # Ensure local imports work
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from events import EventBus, Hit, Miss, ItemPickup, Unjam, ZoneShrink, OutOfZonePenalty
 try:
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
 except:
@@ -61,6 +62,7 @@ tank_blue_img = pygame.transform.rotate(tank_blue_img, -90)
 tank_red_img = pygame.image.load("tank_red.png")
 tank_red_img = pygame.transform.scale(tank_red_img, (CELL_SIZE, CELL_SIZE))
 tank_red_img = pygame.transform.rotate(tank_red_img, -90)
+TANK_IMAGES = {'blue': tank_blue_img, 'red': tank_red_img}
 
 # Load item icons (filenames should be e.g. "double_shot.png", "minus_one.png", etc.)
 item_images = {}
@@ -75,6 +77,16 @@ class Item:
         self.type = type
         self.image = item_images[type]
 
+    # Surfaces can't be pickled; drop them and reload from the type on restore.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['image']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.image = item_images[self.type]
+
 def is_visible(tank, x, y):
     return abs(x - tank.x) <= VIEW_RANGE and abs(y - tank.y) <= VIEW_RANGE
 
@@ -107,6 +119,20 @@ class Tank:
         self.image = pygame.transform.rotate(self.original_image, ANGLE_MAP[self.facing])
         self.rect = self.image.get_rect()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ('original_image', 'image', 'rect'):
+            del state[key]
+        state['sprite'] = next((k for k, img in TANK_IMAGES.items() if img is self.original_image), None)
+        return state
+
+    def __setstate__(self, state):
+        sprite = state.pop('sprite')
+        self.__dict__.update(state)
+        self.original_image = TANK_IMAGES[sprite]
+        self.image = pygame.transform.rotate(self.original_image, ANGLE_MAP[self.facing])
+        self.rect = self.image.get_rect()
+
     def rotate(self):
         if self.desired_direction not in ANGLE_MAP:
             return False
@@ -159,8 +185,55 @@ class Tank:
             self.shoot_cooldown = 4
         return False
 
+_tank_sprites = {}
+
+def tank_sprite(color, facing):
+    key = (color, facing)
+    if key not in _tank_sprites:
+        _tank_sprites[key] = pygame.transform.rotate(TANK_IMAGES[color], ANGLE_MAP[facing])
+    return _tank_sprites[key]
+
+def draw_state(surface, state, names):
+    """Draw a Game.snapshot() onto any WIDTH x HEIGHT surface (tank1 is blue, tank2 red)."""
+    t1, t2 = state['tank1'], state['tank2']
+    walls = set(map(tuple, state['walls']))
+    def seen(x, y):
+        return any(abs(x - t['x']) <= VIEW_RANGE and abs(y - t['y']) <= VIEW_RANGE for t in (t1, t2))
+    surface.fill((0, 0, 0))
+    for x in range(GRID_SIZE):
+        for y in range(GRID_SIZE):
+            px, py = x*CELL_SIZE, y*CELL_SIZE
+            if seen(x, y):
+                surface.blit(background_img, (px, py), (0, 0, CELL_SIZE, CELL_SIZE))
+                if (x, y) in walls:
+                    surface.blit(wall_img, (px, py))
+            else:
+                pygame.draw.rect(surface, (30, 30, 30), (px, py, CELL_SIZE, CELL_SIZE))
+    # draw items
+    for x, y, t in state['items']:
+        if seen(x, y):
+            surface.blit(item_images[t], (x*CELL_SIZE, y*CELL_SIZE))
+    # draw tanks
+    for color, t in (('blue', t1), ('red', t2)):
+        surface.blit(tank_sprite(color, t['facing']), (t['x']*CELL_SIZE, t['y']*CELL_SIZE))
+    # scores
+    blue_text = FONT.render(f"{names[0]}: {t1['score']}", True, WHITE)
+    red_text  = FONT.render(f"{names[1]}: {t2['score']}", True, WHITE)
+    surface.blit(blue_text, (10, 10))
+    surface.blit(red_text, (WIDTH - red_text.get_width() - 10, 10))
+    # draw safe zone
+    x1, y1, x2, y2 = state['safe_zone']
+    rect = pygame.Rect(x1*CELL_SIZE, y1*CELL_SIZE, (x2-x1+1)*CELL_SIZE, (y2-y1+1)*CELL_SIZE)
+    pygame.draw.rect(surface, (0,255,0), rect, 4)
+
 class Game:
-    def __init__(self, agent1, agent2):
+    def __init__(self, agent1, agent2, seed=None):
+        # Engine randomness is kept apart from the agents' so a seed fully
+        # determines walls, spawns, items, zone shrinks and unjam moves.
+        self.rng = random.Random(seed)
+        # Match events (see events.py); only built when someone subscribed
+        self.events = EventBus()
+        self.turn = 0
         self.agent1 = agent1
         self.agent2 = agent2
         self.walls = self.generate_walls()
@@ -182,19 +255,19 @@ class Game:
         walls = set()
         count = int(GRID_SIZE * GRID_SIZE * 0.15)
         while len(walls) < count:
-            x = random.randrange(GRID_SIZE)
-            y = random.randrange(GRID_SIZE)
+            x = self.rng.randrange(GRID_SIZE)
+            y = self.rng.randrange(GRID_SIZE)
             walls.add((x, y))
         # carve escape corridor
-        col = random.randrange(GRID_SIZE)
+        col = self.rng.randrange(GRID_SIZE)
         for y in range(GRID_SIZE):
             walls.discard((col, y))
         return walls
 
     def random_spawn(self, top=True):
         while True:
-            x = random.randrange(GRID_SIZE)
-            y = random.randrange(0, GRID_SIZE//3) if top else random.randrange(2*GRID_SIZE//3, GRID_SIZE)
+            x = self.rng.randrange(GRID_SIZE)
+            y = self.rng.randrange(0, GRID_SIZE//3) if top else self.rng.randrange(2*GRID_SIZE//3, GRID_SIZE)
             if (x, y) not in self.walls:
                 return x, y
 
@@ -223,8 +296,8 @@ class Game:
             cy_max = y2 - new_h // 2
 
             # Pick a random center within those bounds
-            cx = random.randint(cx_min, cx_max)
-            cy = random.randint(cy_min, cy_max)
+            cx = self.rng.randint(cx_min, cx_max)
+            cy = self.rng.randint(cy_min, cy_max)
 
             # Recompute the new zone’s corners based on that center
             nx1 = cx - new_w // 2
@@ -240,43 +313,16 @@ class Game:
         items = []
         for _ in range(5):
             while True:
-                x = random.randrange(GRID_SIZE)
-                y = random.randrange(GRID_SIZE)
+                x = self.rng.randrange(GRID_SIZE)
+                y = self.rng.randrange(GRID_SIZE)
                 if self.grid[y][x] != 'W' and (x, y) not in [(self.agent1_tank.x, self.agent1_tank.y), (self.agent2_tank.x, self.agent2_tank.y)]:
-                    t = random.choice(ITEM_TYPES)
+                    t = self.rng.choice(ITEM_TYPES)
                     items.append(Item(x, y, t))
                     break
         return items
 
     def draw(self):
-        screen.fill((0, 0, 0))
-        for x in range(GRID_SIZE):
-            for y in range(GRID_SIZE):
-                px, py = x*CELL_SIZE, y*CELL_SIZE
-                if is_visible(self.agent1_tank, x, y) or is_visible(self.agent2_tank, x, y):
-                    screen.blit(background_img, (px, py))
-                    if (x, y) in self.walls:
-                        screen.blit(wall_img, (px, py))
-                else:
-                    pygame.draw.rect(screen, (30, 30, 30), (px, py, CELL_SIZE, CELL_SIZE))
-        # draw items
-        for item in self.items:
-            if is_visible(self.agent1_tank, item.x, item.y) or is_visible(self.agent2_tank, item.x, item.y):
-                screen.blit(item.image, (item.x*CELL_SIZE, item.y*CELL_SIZE))
-        # draw tanks
-        if is_visible(self.agent1_tank, self.agent1_tank.x, self.agent1_tank.y):
-            screen.blit(self.agent1_tank.image, (self.agent1_tank.x*CELL_SIZE, self.agent1_tank.y*CELL_SIZE))
-        if is_visible(self.agent2_tank, self.agent2_tank.x, self.agent2_tank.y):
-            screen.blit(self.agent2_tank.image, (self.agent2_tank.x*CELL_SIZE, self.agent2_tank.y*CELL_SIZE))
-        # scores
-        blue_text = FONT.render(f"{self.agent1.name}: {self.agent1_tank.score}", True, WHITE)
-        red_text  = FONT.render(f"{self.agent2.name}: {self.agent2_tank.score}", True, WHITE)
-        screen.blit(blue_text, (10, 10))
-        screen.blit(red_text, (WIDTH - red_text.get_width() - 10, 10))
-        # draw safe zone
-        x1, y1, x2, y2 = self.safe_zone
-        rect = pygame.Rect(x1*CELL_SIZE, y1*CELL_SIZE, (x2-x1+1)*CELL_SIZE, (y2-y1+1)*CELL_SIZE)
-        pygame.draw.rect(screen, (0,255,0), rect, 4)
+        draw_state(screen, self.snapshot(), (self.agent1.name, self.agent2.name))
         pygame.display.flip()
 
     def _can_move(self, x, y):
@@ -309,13 +355,16 @@ class Game:
         if not moved:
             tank.stay_counter += 1
             if tank.stay_counter > 2:
-                dirs = list(DIRECTIONS.keys()); random.shuffle(dirs)
+                dirs = list(DIRECTIONS.keys()); self.rng.shuffle(dirs)
                 for d in dirs:
                     dx, dy = DIRECTIONS[d]
                     if self._can_move(nx:=tank.x+dx, ny:=tank.y+dy) \
                         and self._is_far_enough(nx, ny, enemy_tank):
                         tank.desired_direction = d; tank.rotate(); tank.x, tank.y = nx, ny
-                        tank.stay_counter = 0; break
+                        tank.stay_counter = 0
+                        if self.events.subscribers:
+                            self.events.emit(Unjam(self.turn, self._player(tank), d, nx, ny))
+                        break
         else:
             tank.stay_counter = 0
         # item pickup
@@ -326,43 +375,87 @@ class Game:
                 elif item.type == 'MINUS_ONE': tank.score -= 1
                 elif item.type == 'DOUBLE_COOLDOWN': tank.double_cooldown_active = True
                 self.items.remove(item)
+                if self.events.subscribers:
+                    self.events.emit(ItemPickup(self.turn, self._player(tank), item.type, item.x, item.y))
         # shooting
         if shoot_flag:
-            return tank.shoot(self.grid, enemy_tank)
+            fired = tank.shoot_cooldown == 0
+            hit = tank.shoot(self.grid, enemy_tank)
+            if fired and self.events.subscribers:
+                player = self._player(tank)
+                if hit:
+                    points = 2 if tank.double_damage_active else 1
+                    self.events.emit(Hit(self.turn, player, 3 - player, points))
+                else:
+                    self.events.emit(Miss(self.turn, player))
+            return hit
         return False
 
-    def step_single_agent(self, agent_id):
+    def _player(self, tank):
+        return 1 if tank is self.agent1_tank else 2
+
+    def step_single_agent(self, agent_id, turn=None):
+        # Events are stamped with self.turn; callers stepping agents directly
+        # (without play_turn) get a counter that advances by one per step.
+        self.turn = self.turn + 1 if turn is None else turn
         tank = self.agent1_tank if agent_id==1 else self.agent2_tank
         tank.shoot_cooldown = max(0, tank.shoot_cooldown - 1)
         enemy = self.agent2_tank if agent_id==1 else self.agent1_tank
         hit = self._take_action(self.agent1 if agent_id==1 else self.agent2, tank, enemy, get_enemy_area(enemy))
         return hit, (self.agent1.name if agent_id==1 else self.agent2.name)
 
-if __name__ == "__main__":
-    from agent_blue import AgentBlue
-    from agent_red import AgentRed
-
-    game = Game(AgentBlue("Blue"), AgentRed("Red"))
-    for turn in range(1, MAX_TURNS+1):
-        for e in pygame.event.get():
-            if e.type==pygame.QUIT:
-                pygame.quit(); sys.exit()
+    def play_turn(self, turn):
         current = 1 if turn%2 else 2
-        hit, hitter = game.step_single_agent(current)
+        hit, hitter = self.step_single_agent(current, turn)
         if hit:
-            tank = game.agent1_tank if hitter==game.agent1.name else game.agent2_tank
+            tank = self.agent1_tank if hitter==self.agent1.name else self.agent2_tank
             if tank.double_damage_active:
                 tank.score += 2; tank.double_damage_active = False
             else:
                 tank.score += 1
-        game.update_safe_zone(turn)  # if safe-zone update logic elsewhere
-        # penalty for outside safe zone
+        self.update_safe_zone(turn)
+        if self.events.subscribers and turn in self.shrink_schedule:
+            self.events.emit(ZoneShrink(turn, self.safe_zone))
         if turn % 70 == 0:
-            game.items = game.generate_items()
-        x1,y1,x2,y2 = game.safe_zone
-        for tnk in (game.agent1_tank, game.agent2_tank):
+            self.items = self.generate_items()
+        # penalty for outside safe zone
+        x1,y1,x2,y2 = self.safe_zone
+        for tnk in (self.agent1_tank, self.agent2_tank):
             if not (x1<=tnk.x<=x2 and y1<=tnk.y<=y2) and turn%2==0:
                 tnk.score -= 1
+                if self.events.subscribers:
+                    self.events.emit(OutOfZonePenalty(turn, self._player(tnk), tnk.x, tnk.y))
+
+    def snapshot(self):
+        """Plain, comparable copy of the full game state (no pygame objects)."""
+        def tank_state(t):
+            return {
+                'x': t.x, 'y': t.y, 'facing': t.facing,
+                'desired_direction': t.desired_direction,
+                'stay_counter': t.stay_counter, 'score': t.score,
+                'shoot_cooldown': t.shoot_cooldown,
+                'double_shot_active': t.double_shot_active,
+                'double_damage_active': t.double_damage_active,
+                'double_cooldown_active': t.double_cooldown_active,
+            }
+        return {
+            'walls': sorted(self.walls),
+            'safe_zone': tuple(self.safe_zone),
+            'items': [(it.x, it.y, it.type) for it in self.items],
+            'tank1': tank_state(self.agent1_tank),
+            'tank2': tank_state(self.agent2_tank),
+        }
+
+if __name__ == "__main__":
+    from agent_blue import AgentBlue
+    from agent_red import AgentRed
+
+    game = Game(AgentBlue("Blue"), AgentRed("Red"))
+    for turn in range(1, MAX_TURNS+1):
+        for e in pygame.event.get():
+            if e.type==pygame.QUIT:
+                pygame.quit(); sys.exit()
+        game.play_turn(turn)
         game.draw()
         clock.tick(FPS)
     print(f"Final Score: {game.agent1.name}:{game.agent1_tank.score} - {game.agent2.name}:{game.agent2_tank.score}")
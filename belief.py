@@ -0,0 +1,92 @@
+"""
+Enemy-position belief for agents under fog of war.
+
+Keeps a probability grid over where the enemy tank is. Each `update` call
+(once per `decide`) diffuses the previous belief by one step through cells not
+known to be walls, then keeps only cells consistent with what the agent sees:
+outside the current view, inside `enemy_area`.
+
+    self.belief = EnemyBelief()
+    ...
+    def decide(self, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
+        self.belief.update(tank, visible_enemy, visible_walls, enemy_area)
+        target = visible_enemy or self.belief.most_likely()
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Same values as the engine (agents must not import battlegrid: it opens a window)
+GRID_SIZE  = 15
+VIEW_RANGE = 5
+
+
+class EnemyBelief:
+    def __init__(self, grid_size=GRID_SIZE, view_range=VIEW_RANGE, stay_weight=1.0):
+        self.grid_size = grid_size
+        self.view_range = view_range
+        # Relative weight of "enemy stayed put" against each of the 4 moves
+        self.stay_weight = stay_weight
+        self.free = np.ones((grid_size, grid_size), dtype=bool)   # indexed [y, x]
+        self._free_neighbours = self._count_free_neighbours()
+        self.prob = np.full((grid_size, grid_size), 1.0 / grid_size**2)
+        coords = np.arange(grid_size)
+        self._ys, self._xs = np.meshgrid(coords, coords, indexing='ij')
+
+    def _count_free_neighbours(self):
+        padded = np.pad(self.free, 1, constant_values=False)
+        return (padded[:-2, 1:-1].astype(np.int8) + padded[2:, 1:-1]
+                + padded[1:-1, :-2] + padded[1:-1, 2:])
+
+    def _add_walls(self, walls):
+        if not walls:
+            return
+        xs, ys = np.array(list(walls)).T
+        if self.free[ys, xs].any():
+            self.free[ys, xs] = False
+            self._free_neighbours = self._count_free_neighbours()
+
+    def _diffuse(self):
+        p = self.prob
+        share = p / (self.stay_weight + 4)
+        padded = np.pad(share, 1)
+        incoming = padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
+        # Moves into walls or off the board leave the enemy where it was.
+        blocked = 4 - self._free_neighbours
+        self.prob = (share * (self.stay_weight + blocked) + incoming) * self.free
+
+    def _observation_mask(self, tank, enemy_area):
+        hidden = ((np.abs(self._xs - tank.x) > self.view_range)
+                  | (np.abs(self._ys - tank.y) > self.view_range))
+        if enemy_area is not None:
+            ax1, ax2, ay1, ay2 = enemy_area   # get_enemy_area order: min_x, max_x, min_y, max_y
+            hidden &= (self._xs >= ax1) & (self._xs <= ax2) & (self._ys >= ay1) & (self._ys <= ay2)
+        return hidden & self.free
+
+    def update(self, tank, visible_enemy: Optional[Tuple[int, int]], visible_walls, enemy_area=None):
+        """Advance the belief by one enemy turn and condition it on this observation."""
+        self._add_walls(visible_walls)
+        if visible_enemy is not None:
+            self.prob = np.zeros_like(self.prob)
+            self.prob[visible_enemy[1], visible_enemy[0]] = 1.0
+            return self
+        self._diffuse()
+        mask = self._observation_mask(tank, enemy_area)
+        self.prob *= mask
+        total = self.prob.sum()
+        if total > 0:
+            self.prob /= total
+        elif mask.any():
+            # The enemy moved somewhere the diffusion ruled out: start over from the hint.
+            self.prob = mask / mask.sum()
+        return self
+
+    def most_likely(self) -> Tuple[int, int]:
+        y, x = np.unravel_index(np.argmax(self.prob), self.prob.shape)
+        return int(x), int(y)
+
+    def expected_position(self) -> Tuple[float, float]:
+        return float((self.prob * self._xs).sum()), float((self.prob * self._ys).sum())
+
+    def probability(self, x, y) -> float:
+        return float(self.prob[y, x])
@@ -0,0 +1,140 @@
+"""
+Head-to-head agent comparison that stops as soon as the result is decided.
+
+Runs a sequential probability ratio test (the trinomial GSPRT approximation:
+win = 1, draw = 0.5, loss = 0) between H0 "candidate is elo0 stronger" and
+H1 "candidate is elo1 stronger". Matches are dispatched to a process pool a
+batch at a time, the LLR is updated as each one finishes, and everything still
+queued is cancelled once a bound is crossed.
+
+Each seed is played twice with the agents swapping spawn sides.
+
+Usage:
+    python compare.py agent_blue:AgentBlue agent_red:AgentRed --elo0 0 --elo1 20
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from battlegrid import MAX_TURNS
+from runner import play_match, load_class, agent_name
+
+
+def expected_score(elo):
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class SPRT:
+    def __init__(self, elo0=0.0, elo1=20.0, alpha=0.05, beta=0.05):
+        self.s0, self.s1 = expected_score(elo0), expected_score(elo1)
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+        self.wins = self.draws = self.losses = 0
+
+    @property
+    def n(self):
+        return self.wins + self.draws + self.losses
+
+    def add(self, score):
+        """Record one match from the candidate's side: 1, 0.5 or 0."""
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def llr(self):
+        n = self.n
+        if n == 0:
+            return 0.0
+        mean = (self.wins + 0.5 * self.draws) / n
+        # The variance gets one pseudo win, draw and loss so that a run of
+        # identical results (all wins, all losses) still has a positive
+        # spread and can cross a bound, instead of stalling at LLR 0.
+        w, d, l = self.wins + 1, self.draws + 1, self.losses + 1
+        pseudo_mean = (w + 0.5 * d) / (w + d + l)
+        var = (w + 0.25 * d) / (w + d + l) - pseudo_mean * pseudo_mean
+        return n * (self.s1 - self.s0) * (2 * mean - self.s0 - self.s1) / (2 * var)
+
+    def status(self):
+        llr = self.llr()
+        if llr >= self.upper:
+            return 'H1'
+        if llr <= self.lower:
+            return 'H0'
+        return None
+
+
+def _candidate_score(result, candidate_player):
+    if result['winner'] == 0:
+        return 0.5
+    return 1 if result['winner'] == candidate_player else 0
+
+
+def compare(candidate_cls, baseline_cls, elo0=0.0, elo1=20.0, alpha=0.05, beta=0.05,
+            max_matches=2000, batch=None, workers=None, start_seed=0, turns=MAX_TURNS):
+    """Play candidate vs baseline until the SPRT decides or `max_matches` is reached."""
+    sprt = SPRT(elo0, elo1, alpha, beta)
+    workers = workers or os.cpu_count() or 1
+    batch = batch or 2 * workers
+    next_match = 0
+    pending = {}
+    decision = None
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while decision is None and (pending or next_match < max_matches):
+            # Top the queue up to one batch ahead of the workers.
+            while len(pending) < batch and next_match < max_matches:
+                seed = start_seed + next_match // 2
+                if next_match % 2 == 0:
+                    fut = pool.submit(play_match, candidate_cls, baseline_cls, seed, turns)
+                    pending[fut] = 1
+                else:
+                    fut = pool.submit(play_match, baseline_cls, candidate_cls, seed, turns)
+                    pending[fut] = 2
+                next_match += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                sprt.add(_candidate_score(fut.result(), pending.pop(fut)))
+            decision = sprt.status()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return {
+        'candidate': agent_name(candidate_cls),
+        'baseline': agent_name(baseline_cls),
+        'result': decision or 'inconclusive',
+        'llr': sprt.llr(),
+        'bounds': (sprt.lower, sprt.upper),
+        'wins': sprt.wins, 'draws': sprt.draws, 'losses': sprt.losses,
+        'matches': sprt.n,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SPRT head-to-head comparison of two agents.")
+    parser.add_argument('candidate', help="'module:Class'")
+    parser.add_argument('baseline', help="'module:Class'")
+    parser.add_argument('--elo0', type=float, default=0.0)
+    parser.add_argument('--elo1', type=float, default=20.0)
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--beta', type=float, default=0.05)
+    parser.add_argument('--max-matches', type=int, default=2000)
+    parser.add_argument('--batch', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--turns', type=int, default=MAX_TURNS)
+    args = parser.parse_args()
+    r = compare(load_class(args.candidate), load_class(args.baseline), args.elo0, args.elo1,
+                args.alpha, args.beta, args.max_matches, args.batch, args.workers,
+                args.start_seed, args.turns)
+    print(f"{r['candidate']} vs {r['baseline']}: {r['result']} after {r['matches']} matches "
+          f"(W{r['wins']} D{r['draws']} L{r['losses']}, LLR {r['llr']:.2f} "
+          f"in [{r['bounds'][0]:.2f}, {r['bounds'][1]:.2f}])")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Opt-in memoization of agent decisions.
+
+The bundled agents rebuild their path from scratch every call, and apart from
+the walls they have seen they keep no state between calls. `CachedAgent`
+returns the previous answer when the observation (position, facing, known
+walls, visible enemy, enemy area, safe zone, item hints) repeats (waiting out
+a cooldown, hugging the zone edge), bounded by an LRU.
+
+Only wrap agents whose decision is a function of that observation: stateless
+apart from a `known_walls` set that grows from `visible_walls`. An agent that
+remembers anything else (past enemy sightings, a plan, a turn counter) would
+get stale answers.
+
+    game = Game(CachedAgent(AgentBlue("Blue")), AgentRed("Red"))
+    run_matches([(CachedFactory(AgentBlue), AgentRed, seed) ...])
+
+Caveat: AgentBlue shuffles its BFS directions, so a cached answer is one of the
+equally short paths it could have picked, and the global RNG is consumed less.
+"""
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 4096
+
+
+class CachedAgent:
+    def __init__(self, agent, maxsize=DEFAULT_MAXSIZE):
+        self.agent = agent
+        self.name = agent.name
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        # Known walls only ever grow, so their count identifies the whole set.
+        self.known_walls = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def decide(self, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
+        self.known_walls.update(visible_walls)
+        key = (tank.x, tank.y, tank.facing, len(self.known_walls),
+               visible_enemy, tuple(enemy_area), tuple(safe_zone), tuple(item_hints))
+        decision = self.cache.get(key)
+        if decision is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            # Keep the wrapped agent's wall memory as if it had been called.
+            inner_walls = getattr(self.agent, 'known_walls', None)
+            if inner_walls is not None:
+                inner_walls.update(visible_walls)
+            return decision
+        self.misses += 1
+        decision = self.agent.decide(tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints)
+        self.cache[key] = decision
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+        return decision
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hit_rate, 'size': len(self.cache)}
+
+
+class CachedFactory:
+    """Picklable `agent_cls`-like factory, for use with runner.play_match/run_matches."""
+
+    def __init__(self, agent_cls, maxsize=DEFAULT_MAXSIZE):
+        self.agent_cls = agent_cls
+        self.maxsize = maxsize
+        self.__name__ = f"Cached{agent_cls.__name__}"
+
+    def __call__(self, name):
+        return CachedAgent(self.agent_cls(name), self.maxsize)
@@ -0,0 +1,144 @@
+"""
+Differential test harness: run an alternative engine in lockstep with the
+reference `battlegrid.Game` and report the first turn where their states differ.
+
+A candidate engine must look like `Game` from the outside:
+    Engine(agent1, agent2, seed=...)   # same seed -> same map, spawns, items
+    engine.play_turn(turn)             # turn numbers start at 1
+    engine.snapshot()                  # same dict layout as Game.snapshot()
+
+Usage:
+    python difftest.py my_engine:FastGame --seeds 1000 --turns 1000
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import random
+
+from battlegrid import Game, MAX_TURNS
+from runner import load_class
+from agent_blue import AgentBlue
+from agent_red import AgentRed
+
+
+class RecordingAgent:
+    """Wraps an agent and keeps every (turn, direction, shoot_flag) it returns."""
+
+    def __init__(self, agent):
+        self.agent = agent
+        self.name = agent.name
+        self.actions = []
+        self.turn = 0
+
+    def decide(self, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
+        direction, shoot_flag = self.agent.decide(tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints)
+        self.actions.append((self.turn, direction, shoot_flag))
+        return direction, shoot_flag
+
+
+class _Lane:
+    """One engine plus its own agents and its own copy of the global RNG state.
+
+    Agents draw from the module-level `random`, so each lane swaps its state in
+    before playing a turn and out afterwards; both lanes then see the exact same
+    random stream even though they run interleaved.
+    """
+
+    def __init__(self, engine_cls, agent1_cls, agent2_cls, seed):
+        saved = random.getstate()
+        random.seed(seed)
+        self.agent1 = RecordingAgent(agent1_cls("Blue"))
+        self.agent2 = RecordingAgent(agent2_cls("Red"))
+        self.game = engine_cls(self.agent1, self.agent2, seed=seed)
+        self.rng_state = random.getstate()
+        random.setstate(saved)
+
+    def play_turn(self, turn):
+        saved = random.getstate()
+        random.setstate(self.rng_state)
+        self.agent1.turn = self.agent2.turn = turn
+        try:
+            self.game.play_turn(turn)
+        finally:
+            self.rng_state = random.getstate()
+            random.setstate(saved)
+        return self.game.snapshot()
+
+    def actions(self):
+        return sorted(self.agent1.actions + self.agent2.actions)
+
+
+def diff_states(expected, actual, prefix=''):
+    """List of (path, expected, actual) for every field that differs."""
+    diffs = []
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(set(expected) | set(actual), key=str):
+            diffs += diff_states(expected.get(key), actual.get(key), f"{prefix}{key}.")
+    elif expected != actual:
+        diffs.append((prefix.rstrip('.'), expected, actual))
+    return diffs
+
+
+def run_lockstep(candidate_cls, seed, turns=MAX_TURNS,
+                 agent1_cls=AgentBlue, agent2_cls=AgentRed, reference_cls=Game):
+    """Play one seeded match on both engines; None if they agree, else a replay dict."""
+    ref = _Lane(reference_cls, agent1_cls, agent2_cls, seed)
+    cand = _Lane(candidate_cls, agent1_cls, agent2_cls, seed)
+    last = ref.game.snapshot()
+    diffs = diff_states(last, cand.game.snapshot())
+    turn = 0
+    while not diffs and turn < turns:
+        turn += 1
+        before = last
+        last = ref.play_turn(turn)
+        diffs = diff_states(last, cand.play_turn(turn))
+    if not diffs:
+        return None
+    return {
+        'seed': seed,
+        'turn': turn,
+        'agents': [agent1_cls.__name__, agent2_cls.__name__],
+        'diffs': diffs,
+        'state_before': before if turn else None,
+        'reference_actions': ref.actions(),
+        'candidate_actions': cand.actions(),
+    }
+
+
+def replay(divergence, candidate_cls, agents=None):
+    """Re-run a reported divergence; returns the fresh report (or None if it vanished)."""
+    agents = agents or {'AgentBlue': AgentBlue, 'AgentRed': AgentRed}
+    a1, a2 = (agents[n] for n in divergence['agents'])
+    return run_lockstep(candidate_cls, divergence['seed'], divergence['turn'], a1, a2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('candidate', nargs='?', default='battlegrid:Game',
+                        help="engine to check, as 'module:Class'")
+    parser.add_argument('--seeds', type=int, default=100)
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--out', help="write the first divergence as JSON here")
+    args = parser.parse_args()
+
+    candidate_cls = load_class(args.candidate)
+    for seed in range(args.start_seed, args.start_seed + args.seeds):
+        divergence = run_lockstep(candidate_cls, seed, args.turns)
+        if divergence is None:
+            continue
+        print(f"Divergence at seed {seed}, turn {divergence['turn']}:")
+        for path, expected, actual in divergence['diffs']:
+            print(f"  {path}: reference={expected!r} candidate={actual!r}")
+        if args.out:
+            with open(args.out, 'w') as f:
+                json.dump(divergence, f, indent=2, default=list)
+            print(f"Replay written to {args.out}")
+        raise SystemExit(1)
+    print(f"OK: {args.seeds} seeds x {args.turns} turns identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Typed match events and a small bus that pushes them into generator consumers.
+
+`Game` owns an `EventBus` (`game.events`) and only builds events when someone
+is subscribed, so an unobserved match pays one list check per emit site.
+
+A consumer is a generator that receives events with `yield`:
+
+    def hits_per_player(counts):
+        while True:
+            event = yield
+            if isinstance(event, Hit):
+                counts[event.player] += 1
+
+    counts = {1: 0, 2: 0}
+    game.events.subscribe(hits_per_player(counts))
+
+A consumer that returns is unsubscribed.
+"""
+from collections import Counter, namedtuple
+
+# `player` is 1 for agent1 (blue) and 2 for agent2 (red)
+Hit = namedtuple('Hit', 'turn player target points')
+Miss = namedtuple('Miss', 'turn player')
+ItemPickup = namedtuple('ItemPickup', 'turn player item_type x y')
+Unjam = namedtuple('Unjam', 'turn player direction x y')
+ZoneShrink = namedtuple('ZoneShrink', 'turn safe_zone')
+OutOfZonePenalty = namedtuple('OutOfZonePenalty', 'turn player x y')
+
+EVENT_TYPES = (Hit, Miss, ItemPickup, Unjam, ZoneShrink, OutOfZonePenalty)
+
+
+class EventBus:
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, consumer):
+        """Prime a generator consumer and start sending it events; returns it."""
+        next(consumer)
+        self.subscribers.append(consumer)
+        return consumer
+
+    def unsubscribe(self, consumer):
+        if consumer in self.subscribers:
+            self.subscribers.remove(consumer)
+            consumer.close()
+
+    def emit(self, event):
+        for consumer in list(self.subscribers):
+            try:
+                consumer.send(event)
+            except StopIteration:
+                self.subscribers.remove(consumer)
+
+    # Consumers belong to the process that subscribed them; a pickled game
+    # (see runner.save_match_state) comes back with none.
+    def __getstate__(self):
+        return {'subscribers': []}
+
+
+def collect(events):
+    """Consumer that appends every event to the `events` list."""
+    while True:
+        events.append((yield))
+
+
+def tally(counts=None):
+    """Consumer that counts events per (type name, player); `counts` is a Counter."""
+    counts = Counter() if counts is None else counts
+    while True:
+        event = yield
+        counts[type(event).__name__, getattr(event, 'player', None)] += 1
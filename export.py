@@ -0,0 +1,170 @@
+"""
+Offline export of a match to PNG frames or an animated GIF.
+
+A match is described by its seed and the actions both agents took (a "replay").
+Because the engine draws only from its own seeded RNG, feeding those actions
+back through scripted agents re-simulates the match exactly, in milliseconds.
+The frames are then drawn off-screen with `draw_state`, split across a process
+pool, instead of playing back in real time through `Game.draw`.
+
+GIF output needs Pillow (`pip install pillow`); PNG frames need only pygame.
+Workers convert GIF frames to a palette themselves, and no PNGs are written
+unless `--out` is given.
+
+Usage:
+    python export.py agent_blue:AgentBlue agent_red:AgentRed --seed 7 --gif match.gif
+    python export.py --replay match.json --out frames/
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from battlegrid import Game, WIDTH, HEIGHT, MAX_TURNS, draw_state
+from difftest import RecordingAgent
+from runner import load_class
+
+
+class ScriptedAgent:
+    """Replays a fixed list of (direction, shoot_flag) decisions."""
+
+    def __init__(self, name, actions):
+        self.name = name
+        self.actions = iter(actions)
+
+    def decide(self, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
+        return next(self.actions)
+
+
+def record(agent1_cls, agent2_cls, seed, turns=MAX_TURNS):
+    """Play a match with real agents and return its replay dict."""
+    random.seed(seed)
+    agent1, agent2 = RecordingAgent(agent1_cls("Blue")), RecordingAgent(agent2_cls("Red"))
+    game = Game(agent1, agent2, seed=seed)
+    for turn in range(1, turns+1):
+        game.play_turn(turn)
+    return {
+        'seed': seed,
+        'turns': turns,
+        'names': [agent1.name, agent2.name],
+        'actions': [[[d, s] for _, d, s in agent1.actions], [[d, s] for _, d, s in agent2.actions]],
+    }
+
+
+def simulate(replay):
+    """Re-run a replay; returns the list of snapshots (start of match, then after every turn)."""
+    names = replay['names']
+    game = Game(ScriptedAgent(names[0], map(tuple, replay['actions'][0])),
+                ScriptedAgent(names[1], map(tuple, replay['actions'][1])),
+                seed=replay['seed'])
+    states = [game.snapshot()]
+    for turn in range(1, replay['turns']+1):
+        game.play_turn(turn)
+        states.append(game.snapshot())
+    return states
+
+
+def _require_pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        raise SystemExit("GIF export needs Pillow: pip install pillow")
+    return Image
+
+
+def _render_frames(jobs, names, size, gif):
+    """Worker: draw each (png_path or None, state).
+
+    Saves the PNG when a path is given and, with `gif`, also returns the frame
+    already converted to an adaptive palette so the parent only has to append it.
+    """
+    Image = _require_pillow() if gif else None
+    canvas = pygame.Surface((WIDTH, HEIGHT))
+    paths, frames = [], []
+    for path, state in jobs:
+        draw_state(canvas, state, names)
+        frame = canvas if size == (WIDTH, HEIGHT) else pygame.transform.smoothscale(canvas, size)
+        if path:
+            pygame.image.save(frame, path)
+            paths.append(path)
+        if gif:
+            rgb = Image.frombytes('RGB', size, pygame.image.tobytes(frame, 'RGB'))
+            frames.append(rgb.convert('P', palette=Image.ADAPTIVE))
+    return paths, frames
+
+
+def render_frames(replay, out_dir=None, gif=False, scale=1.0, every=1, workers=None):
+    """Render a replay in parallel: PNGs into `out_dir` (if given) and/or palette
+    frames for a GIF. Returns (png_paths, gif_frames)."""
+    if gif:
+        _require_pillow()
+    if out_dir:
+        out_dir = os.path.abspath(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
+    states = simulate(replay)[::every]
+    size = (round(WIDTH * scale), round(HEIGHT * scale))
+    jobs = [(os.path.join(out_dir, f"frame_{i:05d}.png") if out_dir else None, s)
+            for i, s in enumerate(states)]
+    workers = workers or os.cpu_count() or 1
+    chunk = -(-len(jobs) // workers)
+    chunks = [jobs[i:i+chunk] for i in range(0, len(jobs), chunk)]
+    paths, frames = [], []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part_paths, part_frames in pool.map(_render_frames, chunks, [replay['names']] * len(chunks),
+                                                [size] * len(chunks), [gif] * len(chunks)):
+            paths += part_paths
+            frames += part_frames
+    return paths, frames
+
+
+def export_frames(replay, out_dir, scale=1.0, every=1, workers=None):
+    """Write PNG frames for a replay, rendering chunks of frames in parallel."""
+    return render_frames(replay, out_dir, False, scale, every, workers)[0]
+
+
+def write_gif(frames, path, fps=20):
+    """Assemble palette frames from render_frames(..., gif=True) into an animated GIF."""
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=round(1000 / fps), loop=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a match to PNG frames / animated GIF.")
+    parser.add_argument('agent1', nargs='?', default='agent_blue:AgentBlue')
+    parser.add_argument('agent2', nargs='?', default='agent_red:AgentRed')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--replay', help="replay JSON to export instead of playing agent1 vs agent2")
+    parser.add_argument('--save-replay', help="write the replay JSON here")
+    parser.add_argument('--out', help="directory for PNG frames")
+    parser.add_argument('--gif', help="assemble an animated GIF here")
+    parser.add_argument('--fps', type=float, default=20)
+    parser.add_argument('--scale', type=float, default=0.5)
+    parser.add_argument('--every', type=int, default=1, help="keep every Nth frame")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    if not (args.out or args.gif):
+        parser.error("nothing to export: give --out and/or --gif")
+
+    if args.replay:
+        with open(args.replay) as f:
+            replay = json.load(f)
+    else:
+        replay = record(load_class(args.agent1), load_class(args.agent2), args.seed, args.turns)
+    if args.save_replay:
+        with open(args.save_replay, 'w') as f:
+            json.dump(replay, f)
+    paths, frames = render_frames(replay, args.out, bool(args.gif), args.scale, args.every, args.workers)
+    if args.out:
+        print(f"Wrote {len(paths)} frames to {args.out}")
+    if args.gif:
+        write_gif(frames, args.gif, args.fps / args.every)
+        print(f"Wrote {args.gif}")
+
+
+if __name__ == "__main__":
+    main()
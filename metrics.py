@@ -0,0 +1,242 @@
+"""
+Live throughput and latency metrics for running tournaments.
+
+Workers time each agent's `decide` with `TimedAgent` (two perf_counter calls
+per decision, kept in plain per-agent counters). A `Reporter` hooked into the
+match's `on_turn` sends what changed since its last report through a
+multiprocessing queue about once a second and once more when the match ends,
+so long matches show up while they run. In the parent, `drain` folds those
+deltas into `Metrics`, which `serve` exposes on a local HTTP endpoint in
+Prometheus text format.
+
+    python tournament.py ... --metrics-port 9100
+    python metrics.py http://localhost:9100/metrics     # status view in the terminal
+"""
+import argparse
+import bisect
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds (seconds) of the decide-latency histogram buckets
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+# Seconds between a worker's partial reports for a running match
+REPORT_INTERVAL = 1.0
+
+
+class LatencyStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)   # last one is +Inf
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+
+class TimedAgent:
+    """Agent wrapper that records how long each `decide` call takes."""
+
+    def __init__(self, agent, label=None):
+        self.agent = agent
+        self.name = agent.name
+        self.label = label or type(agent).__name__
+        self.latency = LatencyStats()
+
+    def decide(self, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
+        start = time.perf_counter()
+        decision = self.agent.decide(tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints)
+        self.latency.observe(time.perf_counter() - start)
+        return decision
+
+
+class Reporter:
+    """Worker side: sends the running match's metric deltas to `queue`.
+
+    Pass `on_turn` as play_match's hook; it reports every `interval` seconds.
+    Call `flush(matches=1)` after the match to send the rest with the match count.
+    """
+
+    def __init__(self, queue, interval=REPORT_INTERVAL):
+        self.queue = queue
+        self.interval = interval
+        self.game = None
+        self.turns = 0
+        self.last = time.perf_counter()
+
+    def on_turn(self, game, turn):
+        self.game = game
+        self.turns += 1
+        if time.perf_counter() - self.last >= self.interval:
+            self.flush()
+
+    def flush(self, matches=0):
+        now = time.perf_counter()
+        latency = {}
+        for agent in ((self.game.agent1, self.game.agent2) if self.game else ()):
+            if isinstance(agent, TimedAgent) and agent.latency.count:
+                latency.setdefault(agent.label, LatencyStats()).merge(agent.latency)
+                agent.latency = LatencyStats()   # sent; start the next delta
+        self.queue.put({'turns': self.turns, 'busy_seconds': now - self.last,
+                        'latency': latency, 'matches': matches})
+        self.turns = 0
+        self.last = now
+
+
+class Metrics:
+    """Aggregated tournament metrics; `record` adds one worker report (a delta)."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.started = time.monotonic()
+        self.matches = 0
+        self.turns = 0
+        self.busy_seconds = 0.0
+        self.latency = {}      # agent label -> LatencyStats
+        self.lock = threading.Lock()
+
+    def record(self, turns=0, busy_seconds=0.0, latency=None, matches=0):
+        with self.lock:
+            self.matches += matches
+            self.turns += turns
+            self.busy_seconds += busy_seconds
+            for label, stats in (latency or {}).items():
+                self.latency.setdefault(label, LatencyStats()).merge(stats)
+
+    def snapshot(self):
+        with self.lock:
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            return {
+                'elapsed': elapsed,
+                'matches': self.matches,
+                'turns': self.turns,
+                'matches_per_second': self.matches / elapsed,
+                'turns_per_second': self.turns / elapsed,
+                'worker_utilization': min(1.0, self.busy_seconds / (elapsed * self.workers)),
+                'latency': {label: (s.count, s.total, list(s.buckets)) for label, s in self.latency.items()},
+            }
+
+    def render(self):
+        """Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = [
+            '# HELP battlegrid_matches_total Matches finished.',
+            '# TYPE battlegrid_matches_total counter',
+            f"battlegrid_matches_total {snap['matches']}",
+            '# HELP battlegrid_turns_total Turns played.',
+            '# TYPE battlegrid_turns_total counter',
+            f"battlegrid_turns_total {snap['turns']}",
+            '# HELP battlegrid_matches_per_second Matches per second since start.',
+            '# TYPE battlegrid_matches_per_second gauge',
+            f"battlegrid_matches_per_second {snap['matches_per_second']:.6f}",
+            '# HELP battlegrid_turns_per_second Turns per second since start.',
+            '# TYPE battlegrid_turns_per_second gauge',
+            f"battlegrid_turns_per_second {snap['turns_per_second']:.6f}",
+            '# HELP battlegrid_worker_utilization Fraction of worker time spent playing matches.',
+            '# TYPE battlegrid_worker_utilization gauge',
+            f"battlegrid_worker_utilization {snap['worker_utilization']:.6f}",
+            '# HELP battlegrid_workers Worker processes in the pool.',
+            '# TYPE battlegrid_workers gauge',
+            f"battlegrid_workers {self.workers}",
+            '# HELP battlegrid_decide_seconds Agent decide() latency.',
+            '# TYPE battlegrid_decide_seconds histogram',
+        ]
+        for label, (count, total, buckets) in sorted(snap['latency'].items()):
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS + ('+Inf',), buckets):
+                cumulative += n
+                lines.append(f'battlegrid_decide_seconds_bucket{{agent="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'battlegrid_decide_seconds_sum{{agent="{label}"}} {total:.6f}')
+            lines.append(f'battlegrid_decide_seconds_count{{agent="{label}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def drain(metrics, queue):
+    """Record Reporter deltas from `queue` into `metrics` on a daemon thread until None arrives."""
+    def run():
+        for delta in iter(queue.get, None):
+            metrics.record(**delta)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def serve(metrics, port, host='127.0.0.1'):
+    """Serve `metrics.render()` at http://host:port/metrics from a daemon thread."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip('/') not in ('', '/metrics'):
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def parse(text):
+    """{(name, labels): value} from Prometheus text; labels as a frozenset of (key, value)."""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        series, value = line.rsplit(' ', 1)
+        name, _, labels = series.partition('{')
+        pairs = frozenset(tuple(kv.split('=', 1)) for kv in labels.rstrip('}').split(',') if kv)
+        samples[(name, frozenset((k, v.strip('"')) for k, v in pairs))] = float(value)
+    return samples
+
+
+def status_lines(samples):
+    get = lambda name: samples.get((name, frozenset()), 0.0)
+    lines = [f"matches {get('battlegrid_matches_total'):.0f}  turns {get('battlegrid_turns_total'):.0f}  "
+             f"{get('battlegrid_matches_per_second'):.2f} matches/s  "
+             f"{get('battlegrid_turns_per_second'):.0f} turns/s  "
+             f"workers {get('battlegrid_workers'):.0f} @ {100 * get('battlegrid_worker_utilization'):.0f}%"]
+    agents = sorted(dict(labels)['agent'] for name, labels in samples if name == 'battlegrid_decide_seconds_count')
+    for agent in agents:
+        key = frozenset({('agent', agent)})
+        count = samples[('battlegrid_decide_seconds_count', key)]
+        total = samples[('battlegrid_decide_seconds_sum', key)]
+        lines.append(f"  {agent:20} {count:10.0f} decides  mean {1e3 * total / max(count, 1):.3f} ms")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Terminal status view of a tournament metrics endpoint.")
+    parser.add_argument('url', nargs='?', default='http://127.0.0.1:9100/metrics')
+    parser.add_argument('--interval', type=float, default=2.0)
+    args = parser.parse_args()
+    while True:
+        try:
+            with urllib.request.urlopen(args.url) as resp:
+                lines = status_lines(parse(resp.read().decode()))
+        except OSError as e:
+            raise SystemExit(f"{args.url}: {e}")
+        print('\033[2J\033[H' + '\n'.join(lines), flush=True)
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,99 @@
+"""
+Headless match runner shared by the offline tools (datasets, comparisons, sweeps).
+
+Agents are passed as classes (or any picklable factory taking a name) so jobs
+can be shipped to worker processes.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import importlib
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from battlegrid import Game, MAX_TURNS
+
+
+def play_match(agent1_cls, agent2_cls, seed, turns=MAX_TURNS, wrap=None, on_turn=None,
+               checkpoint=None, checkpoint_every=100, consumers=()):
+    """Play one seeded match without drawing and return its result dict.
+
+    `wrap(agent, player)` may replace each agent (player is 1 or 2), e.g. to
+    record or time its decisions; `on_turn(game, turn)` runs after every turn.
+    `consumers` are generator consumers subscribed to the game's events.
+    With `checkpoint` (a file path) the match state is saved every
+    `checkpoint_every` turns and an existing file is resumed from; the file is
+    removed once the match ends. Checkpointed agents must be picklable.
+    The checkpoint keeps the unwrapped agents, and a resumed match wraps them
+    with this call's `wrap` (or none), whatever the interrupted run used;
+    wrapper state such as recorded actions or timings starts over.
+    """
+    state = load_match_state(checkpoint) if checkpoint and os.path.exists(checkpoint) else None
+    if state is not None:
+        game, first_turn = state['game'], state['turn']
+        random.setstate(state['random'])
+        agents = state['agents']
+    else:
+        random.seed(seed)   # agents draw from the global RNG
+        agents = agent1_cls("Blue"), agent2_cls("Red")
+        game = Game(*agents, seed=seed)
+        first_turn = 1
+    if wrap is not None:
+        game.agent1, game.agent2 = wrap(agents[0], 1), wrap(agents[1], 2)
+    else:
+        game.agent1, game.agent2 = agents
+    for consumer in consumers:
+        game.events.subscribe(consumer)
+    for turn in range(first_turn, turns+1):
+        game.play_turn(turn)
+        if on_turn is not None:
+            on_turn(game, turn)
+        if checkpoint and turn % checkpoint_every == 0 and turn < turns:
+            save_match_state(checkpoint, game, turn+1, agents)
+    if checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    s1, s2 = game.agent1_tank.score, game.agent2_tank.score
+    return {
+        'seed': seed,
+        'agents': (agent_name(agent1_cls), agent_name(agent2_cls)),
+        'scores': (s1, s2),
+        'winner': 1 if s1 > s2 else 2 if s2 > s1 else 0,
+    }
+
+
+def save_match_state(path, game, next_turn, agents=None):
+    """Atomically pickle a running match (game, agents, both RNGs) to `path`.
+
+    `agents` are the unwrapped (agent1, agent2) when the game holds wrappers.
+    """
+    tmp = f"{path}.tmp"
+    state = {'game': game, 'turn': next_turn, 'random': random.getstate(),
+             'agents': agents or (game.agent1, game.agent2)}
+    with open(tmp, 'wb') as f:
+        pickle.dump(state, f)
+    os.replace(tmp, path)
+
+
+def load_match_state(path):
+    """Inverse of save_match_state: {'game', 'turn' (next to play), 'random', 'agents'}."""
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def load_class(spec):
+    """Resolve a 'module:ClassName' string."""
+    module_name, _, attr = spec.partition(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def agent_name(agent_cls):
+    return getattr(agent_cls, '__name__', repr(agent_cls))
+
+
+def run_matches(jobs, workers=None):
+    """Run (agent1_cls, agent2_cls, seed) jobs in a process pool; yields results as they finish."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_match, *job) for job in jobs]
+        for fut in as_completed(futures):
+            yield fut.result()
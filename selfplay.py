@@ -0,0 +1,191 @@
+"""
+Self-play trajectory generation into memory-mapped NumPy shards.
+
+Every decision becomes one fixed-width row of TRANSITION_DTYPE. Each worker
+fills one shard file (`shard-NNNNN.npy`) match by match, and `index.json`
+lists the shards with their row counts, so training code can open everything
+with `np.load(..., mmap_mode='r')` and never load a whole dataset into RAM.
+
+Reward is the change in (own score - enemy score) from just before this decision
+to just before the same player's next one (or the end of the match), so hits,
+item pickups and zone penalties on both sides all count.
+
+Usage:
+    python selfplay.py out_dir --matches 1000 --per-shard 50 --workers 8
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from battlegrid import GRID_SIZE, MAX_TURNS, ITEM_TYPES
+from runner import play_match, agent_name
+from agent_blue import AgentBlue
+from agent_red import AgentRed
+from AgentSimple import AgentSimple
+
+AGENTS = [AgentBlue, AgentRed, AgentSimple]
+DIR_CODES = {'UP': 0, 'DOWN': 1, 'LEFT': 2, 'RIGHT': 3}
+ITEM_CODES = {t: i for i, t in enumerate(ITEM_TYPES)}
+MAX_ITEMS = 5
+WALL_BYTES = (GRID_SIZE * GRID_SIZE + 7) // 8
+
+TRANSITION_DTYPE = np.dtype([
+    ('match',      'u4'),
+    ('turn',       'u2'),
+    ('player',     'u1'),            # 1 = top spawn, 2 = bottom spawn
+    ('pos',        'i1', 2),
+    ('facing',     'u1'),            # DIR_CODES
+    ('cooldown',   'u1'),
+    ('flags',      'u1'),            # bit0 double shot, bit1 double damage, bit2 double cooldown
+    ('score',      'i2'),
+    ('enemy',      'i1', 2),         # (-1, -1) when not visible
+    ('enemy_area', 'i1', 4),
+    ('safe_zone',  'i1', 4),
+    ('items',      'i1', (MAX_ITEMS, 5)),  # x1, y1, x2, y2, ITEM_CODES; -1 rows are padding
+    ('walls',      'u1', WALL_BYTES),      # np.packbits of the visible-wall mask, row-major
+    ('action',     'u1'),            # DIR_CODES
+    ('shoot',      '?'),
+    ('reward',     'i2'),
+    ('done',       '?'),
+])
+
+
+def encode_observation(row, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
+    """Fill the observation fields of one TRANSITION_DTYPE record in place."""
+    row['pos'] = (tank.x, tank.y)
+    row['facing'] = DIR_CODES[tank.facing]
+    row['cooldown'] = tank.shoot_cooldown
+    row['flags'] = (tank.double_shot_active
+                    | tank.double_damage_active << 1
+                    | tank.double_cooldown_active << 2)
+    row['score'] = tank.score
+    row['enemy'] = visible_enemy if visible_enemy is not None else (-1, -1)
+    row['enemy_area'] = enemy_area
+    row['safe_zone'] = safe_zone
+    items = np.full((MAX_ITEMS, 5), -1, dtype=np.int8)
+    for i, (x1, y1, x2, y2, t) in enumerate(item_hints[:MAX_ITEMS]):
+        items[i] = (x1, y1, x2, y2, ITEM_CODES[t])
+    row['items'] = items
+    mask = np.zeros((GRID_SIZE, GRID_SIZE), dtype=bool)
+    if visible_walls:
+        xs, ys = zip(*visible_walls)
+        mask[list(ys), list(xs)] = True
+    row['walls'] = np.packbits(mask)
+
+
+class TransitionRecorder:
+    """Agent wrapper that writes each decision into a shared per-match buffer."""
+
+    def __init__(self, agent, player, buffer, counter):
+        self.agent = agent
+        self.name = agent.name
+        self.player = player
+        self.buffer = buffer
+        self.counter = counter   # one-element list shared by both players: next row
+
+    def decide(self, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints):
+        direction, shoot_flag = self.agent.decide(tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints)
+        row = self.buffer[self.counter[0]]
+        self.counter[0] += 1
+        row['turn'] = self.counter[0]
+        row['player'] = self.player
+        encode_observation(row, tank, visible_enemy, visible_walls, enemy_area, safe_zone, item_hints)
+        row['action'] = DIR_CODES.get(direction, DIR_CODES[tank.facing])
+        row['shoot'] = bool(shoot_flag)
+        return direction, shoot_flag
+
+
+def fill_rewards(rows, scores):
+    """Per-row reward/done from `scores[t]` = (score1, score2) after turn t (row 0 is the start)."""
+    turns = len(rows)
+    margin = scores[:, 0].astype(np.int32) - scores[:, 1]
+    i = np.arange(turns)
+    sign = np.where(rows['player'] == 1, 1, -1)
+    nxt = np.minimum(i + 2, turns)   # the same player decides again two turns later
+    rows['reward'] = sign * (margin[nxt] - margin[i])
+    rows['done'] = i + 2 >= turns
+
+
+def generate_shard(path, matches, turns=MAX_TURNS):
+    """Play `matches` = [(match_id, agent1_cls, agent2_cls, seed)] into one .npy shard."""
+    shard = np.lib.format.open_memmap(path, mode='w+', dtype=TRANSITION_DTYPE,
+                                      shape=(len(matches) * turns,))
+    entries = []
+    for i, (match_id, agent1_cls, agent2_cls, seed) in enumerate(matches):
+        rows = shard[i*turns:(i+1)*turns]
+        counter = [0]
+        scores = np.zeros((turns+1, 2), dtype=np.int32)
+
+        def record_scores(game, turn):
+            scores[turn] = (game.agent1_tank.score, game.agent2_tank.score)
+
+        result = play_match(agent1_cls, agent2_cls, seed, turns,
+                            wrap=lambda agent, player: TransitionRecorder(agent, player, rows, counter),
+                            on_turn=record_scores)
+        rows['match'] = match_id
+        fill_rewards(rows, scores)
+        entries.append({'match': match_id, 'offset': i*turns, 'rows': turns,
+                        'seed': seed, 'agents': result['agents'], 'scores': result['scores']})
+    shard.flush()
+    del shard
+    return {'file': os.path.basename(path), 'rows': len(matches) * turns, 'matches': entries}
+
+
+def generate(out_dir, n_matches, per_shard=50, turns=MAX_TURNS, start_seed=0, workers=None, agents=AGENTS):
+    """Play `n_matches` between every ordered pair of `agents` and write the shards and index.json."""
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    pairs = itertools.cycle(itertools.product(agents, repeat=2))
+    matches = [(m, a1, a2, start_seed + m) for m, (a1, a2) in zip(range(n_matches), pairs)]
+    chunks = [matches[i:i+per_shard] for i in range(0, n_matches, per_shard)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(generate_shard, os.path.join(out_dir, f"shard-{n:05d}.npy"), chunk, turns)
+                   for n, chunk in enumerate(chunks)]
+        shards = [f.result() for f in futures]
+    index = {
+        'dtype': TRANSITION_DTYPE.descr,
+        'turns': turns,
+        'agents': [agent_name(a) for a in agents],
+        'rows': sum(s['rows'] for s in shards),
+        'shards': shards,
+    }
+    with open(os.path.join(out_dir, 'index.json'), 'w') as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+def open_shards(out_dir):
+    """Zero-copy read access: (index, [read-only memmap per shard])."""
+    with open(os.path.join(out_dir, 'index.json')) as f:
+        index = json.load(f)
+    arrays = [np.load(os.path.join(out_dir, s['file']), mmap_mode='r') for s in index['shards']]
+    return index, arrays
+
+
+def unpack_walls(rows):
+    """(N, GRID_SIZE, GRID_SIZE) boolean wall masks from the packed column."""
+    bits = np.unpackbits(rows['walls'], axis=-1, count=GRID_SIZE * GRID_SIZE)
+    return bits.reshape(-1, GRID_SIZE, GRID_SIZE).astype(bool)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate self-play trajectory shards.")
+    parser.add_argument('out_dir')
+    parser.add_argument('--matches', type=int, default=90)
+    parser.add_argument('--per-shard', type=int, default=50)
+    parser.add_argument('--turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    index = generate(args.out_dir, args.matches, args.per_shard, args.turns, args.start_seed, args.workers)
+    print(f"Wrote {index['rows']} transitions in {len(index['shards'])} shards to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
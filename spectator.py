@@ -0,0 +1,119 @@
+"""
+Tiled spectator view: watch many headless matches in one window.
+
+Each tile's matches run in their own process at full speed (or capped with
+`--tps`). A simulation publishes a snapshot at most `--fps` times per second
+into a one-slot queue and never waits on it, so the number of tiles being
+watched doesn't slow the matches down. The window redraws only the tiles that
+changed, at `--fps`, from the latest snapshot of each.
+
+Usage:
+    python spectator.py agent_blue:AgentBlue agent_red:AgentRed --tiles 9 --fps 10
+"""
+import argparse
+import math
+import multiprocessing as mp
+import os
+import queue
+import time
+
+import pygame
+
+from battlegrid import WIDTH, HEIGHT, MAX_TURNS, draw_state
+from runner import play_match, load_class
+
+
+class _Stop(Exception):
+    pass
+
+
+def _simulate(agent_specs, first_seed, stride, turns, fps, tps, states, stop, parent):
+    """Worker: play seeds first_seed, first_seed+stride, ... and publish snapshots."""
+    a1, a2 = (load_class(spec) for spec in agent_specs)
+    min_interval = 1.0 / fps
+    last = [0.0]
+
+    def publish(game, turn):
+        now = time.monotonic()
+        if turn == turns or now - last[0] >= min_interval:
+            # Checked only at frame rate so the per-turn cost stays a clock read.
+            if stop.is_set() or os.getppid() != parent:
+                raise _Stop
+            last[0] = now
+            try:
+                states.put_nowait((seed, turn, game.snapshot()))
+            except queue.Full:
+                pass   # the viewer hasn't taken the previous frame yet; skip this one
+        if tps:
+            time.sleep(1.0 / tps)
+
+    seed = first_seed
+    try:
+        while not stop.is_set():
+            play_match(a1, a2, seed, turns, on_turn=publish)
+            seed += stride
+    except _Stop:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch many headless matches in a tiled window.")
+    parser.add_argument('agent1', nargs='?', default='agent_blue:AgentBlue')
+    parser.add_argument('agent2', nargs='?', default='agent_red:AgentRed')
+    parser.add_argument('--tiles', type=int, default=9)
+    parser.add_argument('--tile-size', type=int, default=None, help="pixels per tile side")
+    parser.add_argument('--fps', type=float, default=10.0, help="window and snapshot frame-rate cap")
+    parser.add_argument('--tps', type=float, default=0.0, help="turns per second per match (0 = unlimited)")
+    parser.add_argument('--turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--start-seed', type=int, default=0)
+    args = parser.parse_args()
+
+    cols = math.ceil(math.sqrt(args.tiles))
+    rows = math.ceil(args.tiles / cols)
+    tile = args.tile_size or max(120, min(WIDTH, 1200 // cols))
+    window = pygame.display.set_mode((cols * tile, rows * tile))
+    pygame.display.set_caption(f"BattleGrid spectator - {args.tiles} matches")
+    font = pygame.font.SysFont(None, 18)
+    canvas = pygame.Surface((WIDTH, HEIGHT))   # full-size board, scaled down per tile
+
+    # Spawned children re-import battlegrid; our window already exists, so from
+    # here on the environment only tells them not to open windows of their own.
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    ctx = mp.get_context('spawn')
+    stop = ctx.Event()
+    queues = [ctx.Queue(maxsize=1) for _ in range(args.tiles)]
+    workers = [ctx.Process(target=_simulate, daemon=True,
+                           args=((args.agent1, args.agent2), args.start_seed + i, args.tiles,
+                                 args.turns, args.fps, args.tps, queues[i], stop, os.getpid()))
+               for i in range(args.tiles)]
+    for w in workers:
+        w.start()
+
+    clock = pygame.time.Clock()
+    try:
+        running = True
+        while running:
+            for e in pygame.event.get():
+                if e.type == pygame.QUIT:
+                    running = False
+            for i, q in enumerate(queues):
+                try:
+                    seed, turn, state = q.get_nowait()
+                except queue.Empty:
+                    continue
+                draw_state(canvas, state, ("Blue", "Red"))
+                pos = ((i % cols) * tile, (i // cols) * tile)
+                window.blit(pygame.transform.smoothscale(canvas, (tile, tile)), pos)
+                label = font.render(f"seed {seed}  turn {turn}", True, (255, 255, 255), (0, 0, 0))
+                window.blit(label, (pos[0] + 4, pos[1] + tile - label.get_height() - 4))
+            pygame.display.flip()
+            clock.tick(args.fps)
+    finally:
+        stop.set()
+        for w in workers:
+            w.join(timeout=2)
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
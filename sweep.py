@@ -0,0 +1,141 @@
+"""
+Agent hyperparameter sweep with successive halving.
+
+Samples configurations of an agent's constructor parameters, plays every
+configuration against fixed opponents, keeps the best 1/eta of them and gives
+the survivors eta times as many matches, until one is left. All configurations
+in a round play the same seeds, and each round's matches are spread over a
+process pool.
+
+Usage:
+    python sweep.py agent_blue:AgentBlue --opponents agent_red:AgentRed AgentSimple:AgentSimple \
+        --configs 27 --eta 3 --min-matches 4
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import functools
+import itertools
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from battlegrid import MAX_TURNS
+from runner import play_match, load_class, agent_name
+
+# Parameters exposed by AgentBlue / AgentRed constructors
+SEARCH_SPACE = {
+    'min_dist':       [2, 3, 4],
+    'shoot_range':    [3, 4, 5],
+    'positive_items': [
+        ('DOUBLE_SHOT', 'DOUBLE_DAMAGE'),
+        ('DOUBLE_SHOT', 'DOUBLE_DAMAGE', 'DOUBLE_COOLDOWN'),
+        ('DOUBLE_DAMAGE',),
+        (),
+    ],
+    'escape':         ['corner', 'edge'],
+}
+
+
+def sample_configs(space, n, rng):
+    """Up to `n` distinct configurations; the whole grid if it is smaller."""
+    grid = [dict(zip(space, values)) for values in itertools.product(*space.values())]
+    return grid if n >= len(grid) else rng.sample(grid, n)
+
+
+def _play_scored(agent_factory, opponent_cls, seed, side, turns):
+    """Play one match and return the configured agent's score (1 / 0.5 / 0) and margin."""
+    if side == 1:
+        r = play_match(agent_factory, opponent_cls, seed, turns)
+    else:
+        r = play_match(opponent_cls, agent_factory, seed, turns)
+    s_me, s_opp = r['scores'] if side == 1 else r['scores'][::-1]
+    score = 0.5 if r['winner'] == 0 else float(r['winner'] == side)
+    return score, s_me - s_opp
+
+
+def _rank(rec):
+    n = max(rec['matches'], 1)
+    return rec['points'] / n, rec['margin'] / n
+
+
+def successive_halving(agent_cls, opponents, configs, eta=3, min_matches=4,
+                       start_seed=0, turns=MAX_TURNS, workers=None):
+    """Return every configuration's record, best first; the first one is the winner."""
+    if not configs:
+        raise ValueError("successive_halving needs at least one configuration")
+    if not opponents:
+        raise ValueError("successive_halving needs at least one opponent")
+    if eta < 2:
+        raise ValueError(f"eta must be at least 2, got {eta}")
+    if min_matches < 1:
+        raise ValueError(f"min_matches must be at least 1, got {min_matches}")
+    records = [{'params': c, 'matches': 0, 'points': 0.0, 'margin': 0, 'round': 0} for c in configs]
+    survivors = list(records)
+    played = 0          # matches per survivor so far; new rounds continue with fresh seeds
+    budget = min_matches
+    rnd = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            rnd += 1
+            jobs = []
+            for rec in survivors:
+                factory = functools.partial(agent_cls, **rec['params'])
+                for j in range(played, budget):
+                    # Both sides of a seed go to the same opponent.
+                    opponent = opponents[(j // 2) % len(opponents)]
+                    seed = start_seed + j // 2
+                    side = 1 if j % 2 == 0 else 2
+                    jobs.append((rec, pool.submit(_play_scored, factory, opponent, seed, side, turns)))
+            for rec, fut in jobs:
+                score, margin = fut.result()
+                rec['matches'] += 1
+                rec['points'] += score
+                rec['margin'] += margin
+                rec['round'] = rnd
+            survivors.sort(key=_rank, reverse=True)
+            survivors = survivors[:max(1, len(survivors) // eta)]
+            if len(survivors) == 1:
+                break
+            played, budget = budget, budget * eta
+    # Later rounds first (they survived longer), then as ranked within a round.
+    records.sort(key=lambda r: (r['round'],) + _rank(r), reverse=True)
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Successive-halving sweep over agent parameters.")
+    parser.add_argument('agent', help="'module:Class' whose constructor takes the swept parameters")
+    parser.add_argument('--opponents', nargs='+', default=['agent_red:AgentRed'])
+    parser.add_argument('--configs', type=int, default=27)
+    parser.add_argument('--eta', type=int, default=3)
+    parser.add_argument('--min-matches', type=int, default=4)
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--out', help="write all records as JSON here")
+    args = parser.parse_args()
+    if args.configs < 1:
+        parser.error("--configs must be at least 1")
+    if args.eta < 2:
+        parser.error("--eta must be at least 2")
+    if args.min_matches < 1:
+        parser.error("--min-matches must be at least 1")
+
+    agent_cls = load_class(args.agent)
+    opponents = [load_class(o) for o in args.opponents]
+    configs = sample_configs(SEARCH_SPACE, args.configs, random.Random(args.start_seed))
+    records = successive_halving(agent_cls, opponents, configs, args.eta, args.min_matches,
+                                 args.start_seed, args.turns, args.workers)
+    print(f"{agent_name(agent_cls)} vs {', '.join(agent_name(o) for o in opponents)}:")
+    for rec in records[:5]:
+        print(f"  round {rec['round']}  {rec['points']:.1f}/{rec['matches']}  "
+              f"margin {rec['margin']:+d}  {rec['params']}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(records, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
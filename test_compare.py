@@ -0,0 +1,28 @@
+from compare import SPRT
+
+
+def run(sprt, score, limit=200):
+    for _ in range(limit):
+        sprt.add(score)
+        if sprt.status() is not None:
+            break
+    return sprt
+
+
+def test_all_wins_accepts_h1():
+    sprt = run(SPRT(elo0=0, elo1=20), 1)
+    assert sprt.status() == 'H1'
+    assert sprt.n < 40
+
+
+def test_all_losses_accepts_h0():
+    sprt = run(SPRT(elo0=0, elo1=20), 0)
+    assert sprt.status() == 'H0'
+    assert sprt.n < 40
+
+
+def test_even_results_stay_undecided():
+    sprt = SPRT(elo0=0, elo1=20)
+    for score in (1, 0, 0.5) * 3:
+        sprt.add(score)
+    assert sprt.status() is None
@@ -0,0 +1,190 @@
+"""
+Round-robin tournament between agents, with checkpoint and resume.
+
+Every ordered pair of distinct agents plays `--seeds` matches in a process
+pool. Progress (completed match IDs and their results, aggregated standings,
+the seeds still outstanding) is written to a JSON checkpoint every
+`--checkpoint-every` finished matches; running the same command again picks up
+from it. With `--match-checkpoint-every N`, each match also saves its own
+state every N turns next to the checkpoint, so a long match that was cut off
+resumes at its last saved turn instead of turn 1. `--metrics-port` serves live
+throughput and decide-latency metrics (see metrics.py).
+
+Usage:
+    python tournament.py agent_blue:AgentBlue agent_red:AgentRed AgentSimple:AgentSimple \
+        --seeds 50 --checkpoint tourney.json
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import itertools
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from battlegrid import MAX_TURNS
+from runner import play_match, load_class
+from metrics import Metrics, Reporter, TimedAgent, drain, serve
+
+
+def schedule(agents, seeds, start_seed=0):
+    """Deterministic match list: [{'id', 'agents': (spec1, spec2), 'seed'}]."""
+    matches = []
+    for s in range(seeds):
+        for a1, a2 in itertools.permutations(agents, 2):
+            matches.append({'id': len(matches), 'agents': (a1, a2), 'seed': start_seed + s})
+    return matches
+
+
+_metrics_queue = None   # set in workers when metrics are served
+
+
+def _init_worker(metrics_queue):
+    global _metrics_queue
+    _metrics_queue = metrics_queue
+
+
+def _play_scheduled(match, turns, match_checkpoint, checkpoint_every, timed=False):
+    """Worker side: play one match. With `timed`, agents are wrapped in TimedAgent
+    and turns, busy time and decide latency stream to the metrics queue."""
+    reporter = Reporter(_metrics_queue) if timed else None
+    a1, a2 = (load_class(spec) for spec in match['agents'])
+    result = play_match(a1, a2, match['seed'], turns,
+                        wrap=(lambda agent, player: TimedAgent(agent)) if timed else None,
+                        on_turn=reporter.on_turn if timed else None,
+                        checkpoint=match_checkpoint, checkpoint_every=checkpoint_every)
+    if timed:
+        reporter.flush(matches=1)
+    return match['id'], result
+
+
+def standings(agents, results):
+    table = {a: {'wins': 0, 'draws': 0, 'losses': 0, 'points': 0.0, 'score_for': 0, 'score_against': 0}
+             for a in agents}
+    for match, result in results:
+        for side, spec in enumerate(match['agents']):
+            row = table[spec]
+            row['score_for'] += result['scores'][side]
+            row['score_against'] += result['scores'][1-side]
+            if result['winner'] == 0:
+                row['draws'] += 1; row['points'] += 0.5
+            elif result['winner'] == side + 1:
+                row['wins'] += 1; row['points'] += 1
+            else:
+                row['losses'] += 1
+    return table
+
+
+class Tournament:
+    def __init__(self, agents, seeds, checkpoint, start_seed=0, turns=MAX_TURNS,
+                 checkpoint_every=10, match_checkpoint_every=None):
+        self.config = {'agents': list(agents), 'seeds': seeds, 'start_seed': start_seed, 'turns': turns}
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.match_checkpoint_every = match_checkpoint_every
+        self.matches = schedule(agents, seeds, start_seed)
+        self.completed = {}          # match id -> result
+        if os.path.exists(checkpoint):
+            self._load()
+
+    @property
+    def match_dir(self):
+        return f"{self.checkpoint}.matches"
+
+    def _load(self):
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+        if state['config'] != self.config:
+            raise ValueError(f"{self.checkpoint} belongs to a different tournament: {state['config']}")
+        self.completed = {int(k): v for k, v in state['completed'].items()}
+
+    def pending(self):
+        return [m for m in self.matches if m['id'] not in self.completed]
+
+    def standings(self):
+        return standings(self.config['agents'],
+                         [(self.matches[i], r) for i, r in sorted(self.completed.items())])
+
+    def save(self):
+        state = {
+            'config': self.config,
+            'completed': {str(k): v for k, v in sorted(self.completed.items())},
+            'standings': self.standings(),
+            'outstanding': [{'id': m['id'], 'seed': m['seed'], 'agents': m['agents']} for m in self.pending()],
+        }
+        tmp = f"{self.checkpoint}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(state, f, indent=1)
+        os.replace(tmp, self.checkpoint)
+
+    def run(self, workers=None, on_result=None, metrics=None):
+        pending = self.pending()
+        if self.match_checkpoint_every:
+            os.makedirs(self.match_dir, exist_ok=True)
+        since_save = 0
+        timed = metrics is not None
+        pool_args = {}
+        if timed:
+            metrics_queue = multiprocessing.Queue()
+            drainer = drain(metrics, metrics_queue)
+            pool_args = {'initializer': _init_worker, 'initargs': (metrics_queue,)}
+        try:
+            with ProcessPoolExecutor(max_workers=workers, **pool_args) as pool:
+                futures = []
+                for m in pending:
+                    match_ckpt = (os.path.join(self.match_dir, f"{m['id']}.pkl")
+                                  if self.match_checkpoint_every else None)
+                    futures.append(pool.submit(_play_scheduled, m, self.config['turns'],
+                                               match_ckpt, self.match_checkpoint_every or 0, timed))
+                try:
+                    for fut in as_completed(futures):
+                        match_id, result = fut.result()
+                        self.completed[match_id] = result
+                        if on_result is not None:
+                            on_result(self.matches[match_id], result)
+                        since_save += 1
+                        if since_save >= self.checkpoint_every:
+                            self.save()
+                            since_save = 0
+                finally:
+                    self.save()
+        finally:
+            if timed:
+                # The workers have exited and flushed their queue, so this arrives last.
+                metrics_queue.put(None)
+                drainer.join()
+        return self.standings()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Round-robin agent tournament with checkpoint/resume.")
+    parser.add_argument('agents', nargs='+', help="'module:Class' specs")
+    parser.add_argument('--seeds', type=int, default=10, help="matches per ordered pair")
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--checkpoint', default='tournament.json')
+    parser.add_argument('--checkpoint-every', type=int, default=10, help="finished matches between saves")
+    parser.add_argument('--match-checkpoint-every', type=int, default=None, help="turns between in-match saves")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    args = parser.parse_args()
+
+    t = Tournament(args.agents, args.seeds, args.checkpoint, args.start_seed, args.turns,
+                   args.checkpoint_every, args.match_checkpoint_every)
+    if t.completed:
+        print(f"Resuming {args.checkpoint}: {len(t.completed)}/{len(t.matches)} matches done")
+    metrics = None
+    if args.metrics_port:
+        metrics = Metrics(args.workers or os.cpu_count() or 1)
+        serve(metrics, args.metrics_port)
+        print(f"Metrics on http://127.0.0.1:{args.metrics_port}/metrics")
+    table = t.run(args.workers, metrics=metrics)
+    for spec, row in sorted(table.items(), key=lambda kv: kv[1]['points'], reverse=True):
+        print(f"{spec:28} {row['points']:6.1f}  W{row['wins']} D{row['draws']} L{row['losses']}  "
+              f"score {row['score_for']} for, {row['score_against']} against")
+
+
+if __name__ == "__main__":
+    main()